@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures.
+
+Tests that only need *an* analyzed article to build reports from share one
+Analyzer for the whole session instead of constructing their own.
+"""
+import pytest
+
+from src.analyzer import Analyzer
+
+
+@pytest.fixture(scope="session")
+def shared_analyzer():
+    """One Analyzer (with a small glossary) reused by every test."""
+    analyzer = Analyzer()
+    analyzer.glossary.add_term("vaccine", ["immunization"])
+    return analyzer
+
+
+@pytest.fixture
+def fresh_article(shared_analyzer):
+    """A newly cleaned and extracted article with one claim and one citation."""
+    return shared_analyzer.add_article(
+        "Coffee always cures everything! Read more at https://test.com/study",
+        "https://test.com"
+    )
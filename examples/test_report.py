@@ -1,7 +1,7 @@
 from src.article import Article
 from src.glossary import Glossary
 from src.risk_scorer import RiskScorer
-from src.analysis_report import AnalysisReport
+from src.csv_report import CSVReport
 
 # Simple test article
 text = "Coffee cures headaches. More info: https://example.com"
@@ -22,7 +22,7 @@ scorer = RiskScorer(article.claims, article.citations, mismatches)
 scorer.calculate()
 
 # Build report
-report = AnalysisReport(
+report = CSVReport(
     article,
     scorer.score,
     mismatches,
@@ -1,5 +1,7 @@
 # src/__init__.py
 
+import importlib
+
 # Import functions from misinfo_library
 from .misinfo_library import (
     normalize_whitespace,
@@ -13,21 +15,40 @@ from .misinfo_library import (
     collect_citations,
     compare_to_glossary,
     score_article,
+    score_and_map,
     build_claim_evidence_map,
     export_flagged_claims,
     summarize_trends,
     cli_search_and_highlight,
 )
 
-# Import class modules (these are separate files, not from misinfo_library!)
-from .article import Article
-from .glossary import Glossary
-from .risk_scorer import RiskScorer
-from .base_report import BaseReport
-from .csv_report import CSVReport
-from .json_report import JSONReport
-from .html_report import HTMLReport
-from .analyzer import Analyzer
+# Class modules (these are separate files, not from misinfo_library!) are
+# imported lazily on first attribute access (PEP 562), so scripts that only
+# need the helper functions don't pay for loading the report machinery.
+_LAZY_CLASSES = {
+    "Article": ".article",
+    "Glossary": ".glossary",
+    "RiskScorer": ".risk_scorer",
+    "BaseReport": ".base_report",
+    "CSVReport": ".csv_report",
+    "JSONReport": ".json_report",
+    "HTMLReport": ".html_report",
+    "Analyzer": ".analyzer",
+    "PersistenceManager": ".persistence",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     # Functions from misinfo_library
@@ -42,6 +63,7 @@ __all__ = [
     "collect_citations",
     "compare_to_glossary",
     "score_article",
+    "score_and_map",
     "build_claim_evidence_map",
     "export_flagged_claims",
     "summarize_trends",
@@ -55,6 +77,7 @@ __all__ = [
     "JSONReport",
     "HTMLReport",
     "Analyzer",
+    "PersistenceManager",
 ]
 
 __version__ = "0.1.0"
\ No newline at end of file
@@ -3,12 +3,79 @@ analyzer.py
 
 High-level orchestrator with pluggable report formats.
 """
+import os
+import uuid
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
 from src.article import Article
 from src.glossary import Glossary
-from src.risk_scorer import RiskScorer
+from src.misinfo_library import _reset_claim_ids
+from src.risk_scorer import EMPTY_CLAIMS, RiskScorer
 from src.csv_report import CSVReport  # FIXED: Was csv_report_final
 
 
+def _prepare_article(text: str, url: str = None) -> Article:
+    """Create an Article and run cleaning and feature extraction on it."""
+    article = Article(text)
+    article.clean()
+    article.extract_claims(min_len=10)
+    article.extract_citations()
+    if url:
+        article.extract_domain(url)
+    return article
+
+
+# Fewest articles handed to each worker task by Analyzer.analyze_batch().
+_BATCH_CHUNK_SIZE = 16
+
+# Target number of tasks per worker, so uneven articles still balance out.
+_BATCH_TASKS_PER_WORKER = 4
+
+# Glossary loaded once per worker process by _init_worker().
+_worker_glossary = None
+
+
+def _init_worker(glossary_block: str, batch: str):
+    """
+    Attach a batch worker process to the analyzer's shared glossary.
+
+    Also moves the worker to a claim ID namespace made of the batch token
+    and its PID, so IDs stay unique across workers and across batches.
+    """
+    global _worker_glossary
+    _reset_claim_ids(batch)
+    _worker_glossary = Glossary.from_shared_memory(glossary_block)
+
+
+def _process_chunk(texts: list, urls: list, report_class):
+    """
+    Run the full pipeline for a chunk of articles.
+
+    The glossary is matched against the whole chunk in one scan. Module-level
+    so it can be pickled and executed in worker processes by
+    Analyzer.analyze_batch().
+    """
+    articles = [_prepare_article(text, url) for text, url in zip(texts, urls)]
+    all_mismatches = _worker_glossary.compare_many(
+        [a.clean_text for a in articles],
+        [a.clean_text_lower for a in articles]
+    )
+
+    reports = []
+    scorer = RiskScorer._from_trusted(EMPTY_CLAIMS, EMPTY_CLAIMS, EMPTY_CLAIMS)
+    for article, mismatches in zip(articles, all_mismatches):
+        scorer._assign(article.claims, article.citations, mismatches,
+                       article.claim_texts)
+        scorer.calculate()
+        reports.append(
+            report_class(article, scorer.score, mismatches, article.citations)
+        )
+    return reports
+
+
 class Analyzer:
     """
     High-level orchestrator that processes articles end to end.
@@ -27,7 +94,15 @@ class Analyzer:
         self._articles = []
         self._glossary = Glossary()
         self._reports = []
+        self._totals = array("d")  # risk totals, one per report
+        # Reused for every article; starts out pointing at shared empty inputs
+        self._scorer = RiskScorer._from_trusted(EMPTY_CLAIMS, EMPTY_CLAIMS, EMPTY_CLAIMS)
         self._report_class = report_class
+        # article -> (glossary version, claims, citations, mismatches, score);
+        # lets analyze_article() re-wrap an unchanged article in a new report
+        # format without scoring it again. Weakly keyed, so entries go away
+        # with their articles.
+        self._score_cache = weakref.WeakKeyDictionary()
     
     # ---------------- Properties ----------------
     
@@ -37,7 +112,8 @@ class Analyzer:
     
     @property
     def reports(self):
-        return self._reports
+        """Return a copy of the generated reports (kept in step with the risk totals)."""
+        return list(self._reports)
     
     # ---------------- Configuration Methods ----------------
     
@@ -63,12 +139,7 @@ class Analyzer:
             text (str): Raw article text
             url (str): URL source for domain extraction
         """
-        article = Article(text)
-        article.clean()
-        article.extract_claims(min_len=10)
-        article.extract_citations()
-        if url:
-            article.extract_domain(url)
+        article = _prepare_article(text, url)
         self._articles.append(article)
         return article
     
@@ -76,34 +147,156 @@ class Analyzer:
         """
         Run glossary comparison, scoring, and report generation.
         
-        Uses the configured report_class to generate the report.
+        Uses the configured report_class to generate the report. Analyzing
+        the same article again (e.g. after set_report_format()) reuses its
+        glossary comparison and score unless the glossary or the article's
+        claims/citations changed in between.
         
         Returns:
             BaseReport subclass instance (CSVReport, JSONReport, or HTMLReport)
         """
-        mismatches = self._glossary.compare(article.clean_text)
-        scorer = RiskScorer(article.claims, article.citations, mismatches)
-        scorer.calculate()
+        version = self._glossary.version
+        try:
+            cached = self._score_cache.get(article)
+        except TypeError:  # not weak-referenceable, so never cached
+            cached = None
+        if (cached is not None and cached[0] == version
+                and cached[1] is article.claims and cached[2] is article.citations):
+            mismatches, score = list(cached[3]), dict(cached[4])
+        else:
+            mismatches = self._glossary.compare(article.clean_text, article.clean_text_lower)
+            scorer = self._scorer
+            # Article and Glossary always produce lists, so skip reset()'s checks
+            scorer._assign(article.claims, article.citations, mismatches,
+                           article.claim_texts)
+            scorer.calculate()
+            score = scorer.score
+            try:
+                self._score_cache[article] = (
+                    version, article.claims, article.citations,
+                    list(mismatches), dict(score)
+                )
+            except TypeError:
+                pass
         
         # Use the injected report class (polymorphism!)
         report = self._report_class(
             article,
-            scorer.score,
+            score,
             mismatches,
             article.citations
         )
         
         self._reports.append(report)
+        self._totals.append(score.get("total", 0))
         return report
     
+    def analyze_articles(self, articles: list, max_workers: int = None):
+        """
+        Analyze already-added articles concurrently in a thread pool.
+
+        Unlike analyze_article(), each article gets its own RiskScorer so the
+        workers share no mutable scoring state. Reports are returned and
+        recorded in input order, exactly as sequential analyze_article()
+        calls would record them. Regex matching holds the GIL, so this helps
+        most when report classes or glossaries do blocking work; use
+        analyze_batch() for CPU-bound scaling across cores.
+
+        Args:
+            articles (list): Article objects, e.g. from add_article()
+            max_workers (int): Worker threads (defaults to os.cpu_count())
+
+        Returns:
+            list of BaseReport subclass instances
+        """
+        articles = list(articles)
+        if not articles:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            reports = list(executor.map(self._analyze_one, articles))
+
+        for report in reports:
+            self._reports.append(report)
+            self._totals.append(report.score.get("total", 0))
+        return reports
+    
+    def _analyze_one(self, article: Article):
+        """Score and report one article with a private scorer (thread-safe)."""
+        mismatches = self._glossary.compare(article.clean_text, article.clean_text_lower)
+        scorer = RiskScorer._from_trusted(
+            article.claims, article.citations, mismatches, article.claim_texts
+        )
+        scorer.calculate()
+        return self._report_class(article, scorer.score, mismatches, article.citations)
+    
+    def analyze_batch(self, texts: list, urls: list = None, max_workers: int = None):
+        """
+        Process many articles in parallel across CPU cores.
+
+        Each article is cleaned, compared to the glossary, scored, and wrapped
+        in the configured report class inside a worker process. Results are
+        returned in input order and recorded exactly as analyze_article() would.
+
+        Args:
+            texts (list): Raw article texts
+            urls (list): Optional URL per text (same length as texts)
+            max_workers (int): Worker processes (defaults to os.cpu_count())
+
+        Returns:
+            list of BaseReport subclass instances
+
+        Raises:
+            ValueError: If urls and texts have different lengths
+        """
+        texts = list(texts)
+        urls = [None] * len(texts) if urls is None else list(urls)
+        if len(urls) != len(texts):
+            raise ValueError("urls must have the same length as texts")
+        if not texts:
+            return []
+
+        workers = max_workers or os.cpu_count() or 1
+        # Large batches get bigger chunks to amortize pickling; small ones
+        # never drop below _BATCH_CHUNK_SIZE articles per task.
+        step = max(
+            _BATCH_CHUNK_SIZE,
+            -(-len(texts) // (workers * _BATCH_TASKS_PER_WORKER))
+        )
+        starts = range(0, len(texts), step)
+        # Publish the glossary once; workers attach to it in their initializer
+        # rather than unpickling a copy with every chunk.
+        glossary_block = self._glossary.to_shared_memory()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(glossary_block.name, uuid.uuid4().hex[:8])
+            ) as executor:
+                chunks = executor.map(
+                    _process_chunk,
+                    (texts[i:i + step] for i in starts),
+                    (urls[i:i + step] for i in starts),
+                    repeat(self._report_class)
+                )
+                reports = [report for chunk in chunks for report in chunk]
+        finally:
+            glossary_block.close()
+            glossary_block.unlink()
+
+        for report in reports:
+            self._articles.append(report._article)
+            self._reports.append(report)
+            self._totals.append(report.score.get("total", 0))
+        return reports
+    
     def summarize_trends(self):
         """
         Compute average risk across all processed articles.
         """
-        if not self._reports:
+        if not self._totals:
             return {"average_risk": 0.0}
-        total = sum(r.score.get("total", 0) for r in self._reports)
-        return {"average_risk": total / len(self._reports)}
+        return {"average_risk": sum(self._totals) / len(self._totals)}
     
     # ---------------- String Representations ----------------
     
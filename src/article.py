@@ -3,6 +3,7 @@ from src.misinfo_library import (
     extract_domain,
     find_claim_sentences,
     collect_citations,
+    build_claim_evidence_map,
 )
 
 
@@ -15,6 +16,19 @@ class Article:
     and analyze the article content.
     """
 
+    __slots__ = (
+        "_text",
+        "_clean_text",
+        "_clean_text_lower",
+        "_domain",
+        "_claim_ids",
+        "_claim_texts",
+        "_claims",
+        "_citations",
+        "_evidence_map",
+        "__weakref__",  # lets Analyzer cache scores without keeping articles alive
+    )
+
     def __init__(self, text: str):
         """
         Initialize an Article instance.
@@ -33,9 +47,13 @@ class Article:
 
         self._text = text
         self._clean_text = None
+        self._clean_text_lower = None
         self._domain = None
-        self._claims = []
+        self._claim_ids = []
+        self._claim_texts = []
+        self._claims = []  # {'id', 'text'} dicts kept for report/scorer callers
         self._citations = []
+        self._evidence_map = None
 
     # --------------------- Properties ---------------------
 
@@ -49,11 +67,28 @@ class Article:
         """Return the cleaned text."""
         return self._clean_text
 
+    @property
+    def clean_text_lower(self) -> str:
+        """Return the lowercased cleaned text, computed once and cached."""
+        if self._clean_text_lower is None and self._clean_text is not None:
+            self._clean_text_lower = self._clean_text.lower()
+        return self._clean_text_lower
+
     @property
     def claims(self) -> list:
-        """Return extracted claim sentences."""
+        """Return extracted claim sentences as {'id', 'text'} dicts."""
         return self._claims
 
+    @property
+    def claim_ids(self) -> list:
+        """Return the IDs of extracted claims, parallel to claim_texts."""
+        return self._claim_ids
+
+    @property
+    def claim_texts(self) -> list:
+        """Return the text of extracted claims, parallel to claim_ids."""
+        return self._claim_texts
+
     @property
     def citations(self) -> list:
         """Return extracted citations."""
@@ -64,11 +99,27 @@ class Article:
         """Return extracted domain name."""
         return self._domain
 
+    @property
+    def evidence_map(self) -> dict:
+        """
+        Return the claim-to-citation mapping for this article.
+
+        The mapping is built on first access and reused by every report
+        generated for the article until claims or citations are re-extracted.
+        """
+        if self._evidence_map is None:
+            self._evidence_map = build_claim_evidence_map(
+                self._claims,
+                self._citations
+            )
+        return self._evidence_map
+
     # --------------------- Methods ---------------------
 
     def clean(self):
         """Clean the text using the Project 1 whitespace normalizer."""
         self._clean_text = normalize_whitespace(self._text)
+        self._clean_text_lower = None
 
     def extract_domain(self, url: str):
         """
@@ -83,18 +134,23 @@ class Article:
         """Extract claim sentences from cleaned text."""
         if self._clean_text is None:
             self.clean()
-        self._claims = find_claim_sentences(self._clean_text, min_len=min_len)
+        found = find_claim_sentences(self._clean_text, min_len=min_len)
+        self._claim_ids = [c["id"] for c in found]
+        self._claim_texts = [c["text"] for c in found]
+        self._claims = found
+        self._evidence_map = None
 
     def extract_citations(self):
         """Extract URLs and quotes from the cleaned text."""
         if self._clean_text is None:
             self.clean()
         self._citations = collect_citations(self._clean_text)
+        self._evidence_map = None
 
     # --------------------- String Representations ---------------------
 
     def __str__(self) -> str:
-        return f"Article(domain={self._domain}, claims={len(self._claims)})"
+        return f"Article(domain={self._domain}, claims={len(self._claim_texts)})"
 
     def __repr__(self) -> str:
         return f"Article(text_len={len(self._text)})"
\ No newline at end of file
@@ -15,6 +15,15 @@ class BaseReport(ABC):
     to provide format-specific summaries.
     """
     
+    __slots__ = (
+        "_article",
+        "_score",
+        "_mismatches",
+        "_citations",
+        "_evidence_map",
+        "_ctx",
+    )
+    
     def __init__(self, article, score: dict, mismatches: list, citations: list):
         """
         Initialize a BaseReport.
@@ -22,26 +31,22 @@ class BaseReport(ABC):
         Args:
             article (Article): article object that was analyzed
             score (dict): risk score dictionary
-            mismatches (list): glossary mismatches
-            citations (list): extracted citations
+            mismatches (list or tuple): glossary mismatches
+            citations (list or tuple): extracted citations
         """
         if not isinstance(score, dict):
             raise TypeError("score must be a dictionary")
-        if not isinstance(mismatches, list):
-            raise TypeError("mismatches must be a list")
-        if not isinstance(citations, list):
-            raise TypeError("citations must be a list")
+        if not isinstance(mismatches, (list, tuple)):
+            raise TypeError("mismatches must be a list or tuple")
+        if not isinstance(citations, (list, tuple)):
+            raise TypeError("citations must be a list or tuple")
             
         self._article = article
         self._score = score
         self._mismatches = mismatches
         self._citations = citations
-        
-        # Build evidence map (shared across all report types)
-        self._evidence_map = build_claim_evidence_map(
-            article.claims,
-            citations
-        )
+        self._evidence_map = None  # built on first access, see evidence_map
+        self._ctx = None  # article-derived fields, filled in by _context()
     
     # --------- Properties (shared by all reports) ---------
     
@@ -62,7 +67,25 @@ class BaseReport(ABC):
     
     @property
     def evidence_map(self):
-        """Return claim-to-evidence mapping."""
+        """
+        Return claim-to-evidence mapping (shared across all report types).
+        
+        Built on first access, so reports that never read it skip the work.
+        Reports built from the article's own citations copy the map cached
+        on the article rather than rebuilding it; each report still gets its
+        own dict and lists.
+        """
+        if self._evidence_map is None:
+            if self._citations is self._article.citations:
+                self._evidence_map = {
+                    claim_id: list(related)
+                    for claim_id, related in self._article.evidence_map.items()
+                }
+            else:
+                self._evidence_map = build_claim_evidence_map(
+                    self._article.claims,
+                    self._citations
+                )
         return self._evidence_map
     
     # --------- Abstract Methods (must be implemented by subclasses) ---------
@@ -88,14 +111,38 @@ class BaseReport(ABC):
         
         Subclasses can override to provide format-specific summaries.
         """
+        ctx = self._context()
         return {
-            "domain": self._article.domain,
-            "claims_found": len(self._article.claims),
-            "citations_found": len(self._citations),
-            "mismatches": len(self._mismatches),
+            "domain": ctx["domain"],
+            "claims_found": ctx["n_claims"],
+            "citations_found": ctx["n_citations"],
+            "mismatches": ctx["n_mismatches"],
             "risk_total": self._score.get("total", 0)
         }
     
+    def _context(self) -> dict:
+        """
+        Return the article-derived fields shared by summary() and export().
+        
+        Computed on first use and cached, so a report that is summarized and
+        exported (possibly in several formats) reads the article only once.
+        """
+        ctx = self._ctx
+        if ctx is None:
+            article = self._article
+            text = article.text
+            clean_text = article.clean_text
+            ctx = self._ctx = {
+                "domain": article.domain,
+                "n_claims": len(article.claims),
+                "n_citations": len(self._citations),
+                "n_mismatches": len(self._mismatches),
+                "text_len": len(text),
+                "clean_text_len": len(clean_text) if clean_text else 0,
+                "preview": text[:200] + "..." if len(text) > 200 else text,
+            }
+        return ctx
+    
     def get_risk_level(self) -> str:
         """
         Classify risk level based on total score.
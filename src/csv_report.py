@@ -15,6 +15,8 @@ class CSVReport(BaseReport):
     with the existing codebase.
     """
     
+    __slots__ = ()
+    
     def export(self, path: str = "report_output.csv") -> str:
         """
         Export all flagged claims and risk scores to CSV.
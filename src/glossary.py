@@ -1,23 +1,130 @@
-from src.misinfo_library import compare_to_glossary
+import pickle
+import re
+import sys
+from bisect import bisect_right
+from multiprocessing import shared_memory
+from types import MappingProxyType
+
+# Joins texts for a batch scan; never produced by lowercasing article text.
+_BATCH_SEPARATOR = "\x1f"
+
+
+class _TermDict(dict):
+    """
+    The glossary's term -> phrases dict, counting every change made to it.
+
+    Glossary.terms hands this dict out, so edits made through it (even via a
+    reference kept from earlier) must still invalidate the compiled matcher.
+    """
+
+    changes = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.changes += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.changes += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self.changes += 1
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self.changes += 1
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.changes += 1
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.changes += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.changes += 1
 
 
 class Glossary:
     """
     Represents a collection of trusted medical terms and their approved phrases.
 
-    This class wraps the Project 1 glossary comparison function and provides
+    This class wraps the Project 1 glossary comparison logic and provides
     methods to add, remove, and validate glossary entries.
     """
 
+    __slots__ = (
+        "_glossary",
+        "_matcher",
+        "_implied",
+        "_order",
+        "_pairs",
+        "_phrases",
+        "_mutable",
+        "_built",
+        "_frozen",
+    )
+
     def __init__(self):
         """Initialize an empty glossary dictionary."""
-        self._glossary = {}
+        self._glossary = _TermDict()
+        self._matcher = None
+        self._implied = {}
+        self._order = {}
+        self._pairs = {}
+        self._phrases = {}
+        self._mutable = ()
+        self._built = None  # _glossary.changes when the matcher was compiled
+        self._frozen = False
 
     @property
     def terms(self) -> dict:
-        """Return the internal glossary dictionary."""
+        """
+        Return the internal glossary dictionary.
+
+        Edits made directly to it are picked up by the next compare(). A
+        frozen glossary returns a read-only view instead.
+        """
+        if self._frozen:
+            return MappingProxyType(self._glossary)
         return self._glossary
 
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever terms are added, removed or edited."""
+        self._stale()
+        return self._glossary.changes
+
+    @property
+    def frozen(self) -> bool:
+        """Return True once freeze() has made the glossary read-only."""
+        return self._frozen
+
+    def freeze(self):
+        """
+        Compile the glossary matcher now and make the glossary read-only.
+
+        Useful before batch analysis: the compiled pattern is built once and
+        shipped to workers as-is instead of being rebuilt on first compare().
+
+        Returns:
+            Glossary: this glossary, for chaining
+        """
+        if self._stale():
+            self._build()
+        self._frozen = True
+        return self
+
     def add_term(self, term: str, phrases: list[str]):
         """
         Add a new term and its allowed phrases.
@@ -28,29 +135,187 @@ class Glossary:
 
         Raises:
             TypeError: if term is not string or phrases is not list
+            RuntimeError: if the glossary has been frozen
         """
+        if self._frozen:
+            raise RuntimeError("cannot add terms to a frozen glossary")
         if not isinstance(term, str):
             raise TypeError("term must be a string")
         if not isinstance(phrases, list):
             raise TypeError("phrases must be a list of strings")
 
-        self._glossary[term.lower()] = set(p.lower() for p in phrases)
+        self._glossary[sys.intern(term.lower())] = frozenset(p.lower() for p in phrases)
 
     def remove_term(self, term: str):
         """Remove a term from the glossary if it exists."""
-        self._glossary.pop(term.lower(), None)
+        if self._frozen:
+            raise RuntimeError("cannot remove terms from a frozen glossary")
+        if term.lower() in self._glossary:
+            del self._glossary[term.lower()]
+
+    def to_shared_memory(self):
+        """
+        Pickle the glossary into a new shared memory block.
+
+        Worker processes attach to the block by name with from_shared_memory()
+        instead of receiving a pickled copy with every task. The caller owns
+        the block and must close() and unlink() it when the workers are done.
 
-    def compare(self, text: str):
+        Returns:
+            multiprocessing.shared_memory.SharedMemory
+        """
+        if self._stale():
+            self._build()
+        payload = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        block = shared_memory.SharedMemory(create=True, size=len(payload))
+        block.buf[:len(payload)] = payload
+        return block
+
+    @staticmethod
+    def from_shared_memory(name: str):
+        """
+        Load a glossary published by to_shared_memory().
+
+        Args:
+            name (str): name of the shared memory block
+
+        Returns:
+            Glossary
+        """
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            return pickle.loads(block.buf)
+        finally:
+            block.close()
+
+    def _build(self):
+        """
+        Compile every term into a single pattern so compare() scans text once.
+
+        Terms are tried longest first, so each match reports the longest term
+        starting at that position; shorter terms contained in it are resolved
+        through _implied_terms(). Terms and phrases are matched lowercased,
+        so entries added directly through terms need not be lowercase.
+
+        Raises:
+            TypeError: if a term's phrases are not a set or frozenset
+        """
+        phrases = {}
+        for term, allowed in self._glossary.items():
+            if not isinstance(allowed, (set, frozenset)):
+                raise TypeError("glossary values must be sets of strings")
+            phrases[term] = tuple(p.lower() for p in allowed)
+
+        lowered = sorted({term.lower() for term in phrases}, key=len, reverse=True)
+        if lowered:
+            alternation = "|".join(re.escape(t) for t in lowered)
+            self._matcher = re.compile(f"(?=({alternation}))")
+        else:
+            self._matcher = None
+        self._phrases = phrases
+        # Plain sets can be edited in place, so keep a copy to check against
+        self._mutable = tuple(
+            (allowed, frozenset(allowed))
+            for allowed in self._glossary.values() if isinstance(allowed, set)
+        )
+        self._implied = {}
+        self._order = {term: i for i, term in enumerate(phrases)}
+        # compare() results are immutable, so every call can share these tuples
+        self._pairs = {term: (term, "mismatch") for term in phrases}
+        self._built = self._glossary.changes
+
+    def _stale(self) -> bool:
+        """Return True if the terms changed since the matcher was compiled."""
+        if self._mutable and any(allowed != copy for allowed, copy in self._mutable):
+            self._glossary.changes += 1  # an in-place edit to a phrase set
+            self._mutable = ()
+        return self._built != self._glossary.changes
+
+    def _implied_terms(self, hit: str) -> list:
+        """Return every glossary term found inside a matched term (cached)."""
+        implied = self._implied.get(hit)
+        if implied is None:
+            implied = [t for t in self._phrases if t.lower() in hit]
+            self._implied[hit] = implied
+        return implied
+
+    def compare(self, text: str, text_lower: str = None):
         """
         Compare article text to glossary definitions.
 
+        Args:
+            text (str): article text
+            text_lower (str): text already lowercased by the caller, if available
+
         Returns:
             list of (term, 'mismatch') tuples
         """
-        return compare_to_glossary(text, self._glossary)
+        if not isinstance(text, str):
+            raise TypeError("text must be a string")
+        if self._stale():
+            self._build()
+        if self._matcher is None:
+            return []
+
+        lower = text.lower() if text_lower is None else text_lower
+        return self._mismatches(set(self._matcher.findall(lower)), lower)
+
+    def compare_many(self, texts: list, texts_lower: list = None) -> list:
+        """
+        Compare several article texts to the glossary in a single scan.
+
+        The lowercased texts are joined with a separator and scanned once;
+        each hit is attributed back to its text by offset.
+
+        Args:
+            texts (list[str]): article texts
+            texts_lower (list[str]): the same texts already lowercased, if available
+
+        Returns:
+            list of mismatch lists, one per text, as returned by compare()
+        """
+        if not isinstance(texts, list):
+            raise TypeError("texts must be a list of strings")
+        if texts_lower is None:
+            for text in texts:
+                if not isinstance(text, str):
+                    raise TypeError("texts must be a list of strings")
+            texts_lower = [text.lower() for text in texts]
+        if self._stale():
+            self._build()
+        if self._matcher is None or not texts_lower:
+            return [[] for _ in texts_lower]
+
+        starts = []
+        offset = 0
+        for lower in texts_lower:
+            starts.append(offset)
+            offset += len(lower) + len(_BATCH_SEPARATOR)
+
+        hits = [set() for _ in texts_lower]
+        combined = _BATCH_SEPARATOR.join(texts_lower)
+        for match in self._matcher.finditer(combined):
+            hits[bisect_right(starts, match.start()) - 1].add(match.group(1))
+
+        return [
+            self._mismatches(found, lower)
+            for found, lower in zip(hits, texts_lower)
+        ]
+
+    def _mismatches(self, hits: set, lower: str) -> list:
+        """Turn matched terms into (term, 'mismatch') tuples in glossary order."""
+        present = set()
+        for hit in hits:
+            present.update(self._implied_terms(hit))
+
+        return [
+            self._pairs[term]
+            for term in sorted(present, key=self._order.__getitem__)
+            if not any(p in lower for p in self._phrases[term])
+        ]
 
     def __str__(self) -> str:
         return f"Glossary(terms={len(self._glossary)})"
 
     def __repr__(self) -> str:
-        return f"Glossary({self._glossary})"
\ No newline at end of file
+        return f"Glossary({self._glossary})"
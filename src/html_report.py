@@ -4,141 +4,167 @@ html_report.py
 HTML format report implementation with visual styling.
 """
 from datetime import datetime
+from html import escape as _esc
 from src.base_report import BaseReport
 
 
-class HTMLReport(BaseReport):
-    """
-    Exports analysis results to HTML format with styling and visualization.
-    
-    HTML format provides:
-    - Human-readable output
-    - Color-coded risk levels
-    - Browser-viewable reports
-    - Easy sharing and presentation
-    """
-    
-    def export(self, path: str = "report_output.html") -> str:
-        """
-        Export analysis to styled HTML document.
-        
-        Args:
-            path (str): Output HTML file path
-            
-        Returns:
-            str: Path to the exported HTML file
-        """
-        risk_level = self.get_risk_level()
-        risk_class = risk_level.lower()
-        
-        html = f"""<!DOCTYPE html>
+# Static markup around the report body. Plain strings built once at import,
+# so the stylesheet's braces need no escaping and are never re-interpolated.
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Health Article Analysis Report</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             max-width: 1000px;
             margin: 0 auto;
             padding: 40px 20px;
             background-color: #f5f5f5;
             color: #333;
-        }}
-        .container {{
+        }
+        .container {
             background-color: white;
             padding: 30px;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #2c3e50;
             border-bottom: 3px solid #3498db;
             padding-bottom: 10px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #34495e;
             margin-top: 30px;
-        }}
-        .risk-badge {{
+        }
+        .risk-badge {
             display: inline-block;
             padding: 10px 20px;
             border-radius: 5px;
             font-weight: bold;
             font-size: 18px;
             margin: 20px 0;
-        }}
-        .risk-low {{
+        }
+        .risk-low {
             background-color: #2ecc71;
             color: white;
-        }}
-        .risk-medium {{
+        }
+        .risk-medium {
             background-color: #f39c12;
             color: white;
-        }}
-        .risk-high {{
+        }
+        .risk-high {
             background-color: #e74c3c;
             color: white;
-        }}
-        .metric {{
+        }
+        .metric {
             background-color: #ecf0f1;
             padding: 15px;
             margin: 10px 0;
             border-radius: 5px;
             border-left: 4px solid #3498db;
-        }}
-        .metric-label {{
+        }
+        .metric-label {
             font-weight: bold;
             color: #7f8c8d;
-        }}
-        .metric-value {{
+        }
+        .metric-value {
             font-size: 24px;
             color: #2c3e50;
-        }}
-        .claim-list, .citation-list, .mismatch-list {{
+        }
+        .claim-list, .citation-list, .mismatch-list {
             background-color: #f9f9f9;
             padding: 15px;
             border-radius: 5px;
             margin: 10px 0;
-        }}
-        .claim-item, .citation-item, .mismatch-item {{
+        }
+        .claim-item, .citation-item, .mismatch-item {
             padding: 10px;
             margin: 8px 0;
             background-color: white;
             border-left: 3px solid #3498db;
             border-radius: 3px;
-        }}
-        .mismatch-item {{
+        }
+        .mismatch-item {
             border-left-color: #e74c3c;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             color: #7f8c8d;
             font-size: 14px;
             margin-top: 30px;
             text-align: center;
-        }}
-        .score-breakdown {{
+        }
+        .score-breakdown {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin: 20px 0;
-        }}
-        .score-item {{
+        }
+        .score-item {
             background-color: #ecf0f1;
             padding: 15px;
             border-radius: 5px;
             text-align: center;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>🏥 Health Article Analysis Report</h1>
         
-        <div class="metric">
+"""
+
+_HTML_TAIL = """
+        </div>
+    </div>
+</body>
+</html>"""
+
+# CSS class suffix for each level returned by get_risk_level().
+_RISK_CLASS_MAP = {"Low": "low", "Medium": "medium", "High": "high"}
+
+
+class HTMLReport(BaseReport):
+    """
+    Exports analysis results to HTML format with styling and visualization.
+    
+    HTML format provides:
+    - Human-readable output
+    - Color-coded risk levels
+    - Browser-viewable reports
+    - Easy sharing and presentation
+    """
+    
+    __slots__ = ()
+    
+    def export(self, path: str = "report_output.html", timestamp: str = None) -> str:
+        """
+        Export analysis to styled HTML document.
+        
+        Args:
+            path (str): Output HTML file path
+            timestamp (str): "Report generated" time to show; pass one value
+                             to every report in a batch to avoid a clock read
+                             per report. Defaults to the current time.
+            
+        Returns:
+            str: Path to the exported HTML file
+        """
+        risk_level = self.get_risk_level()
+        risk_class = _RISK_CLASS_MAP.get(risk_level) or risk_level.lower()
+        ctx = self._context()
+        domain = _esc(ctx["domain"] or 'Unknown')
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        parts = [
+            _HTML_HEAD,
+            f"""        <div class="metric">
             <div class="metric-label">Source Domain</div>
-            <div class="metric-value">{self._article.domain or 'Unknown'}</div>
+            <div class="metric-value">{domain}</div>
         </div>
         
         <div class="risk-badge risk-{risk_class}">
@@ -169,30 +195,35 @@ class HTMLReport(BaseReport):
             </div>
         </div>
         
-        <h2>📝 Claims Detected ({len(self._article.claims)})</h2>
+        <h2>📝 Claims Detected ({ctx["n_claims"]})</h2>
         <div class="claim-list">
-            {self._generate_claim_html()}
+            """,
+            self._generate_claim_html(),
+            f"""
         </div>
         
-        <h2>📚 Citations Found ({len(self._citations)})</h2>
+        <h2>📚 Citations Found ({ctx["n_citations"]})</h2>
         <div class="citation-list">
-            {self._generate_citation_html()}
+            """,
+            self._generate_citation_html(),
+            f"""
         </div>
         
-        <h2>⚠️ Glossary Mismatches ({len(self._mismatches)})</h2>
+        <h2>⚠️ Glossary Mismatches ({ctx["n_mismatches"]})</h2>
         <div class="mismatch-list">
-            {self._generate_mismatch_html()}
+            """,
+            self._generate_mismatch_html(),
+            f"""
         </div>
         
         <div class="timestamp">
-            Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        </div>
-    </div>
-</body>
-</html>"""
+            Report generated: {timestamp}""",
+            _HTML_TAIL,
+        ]
         
+        # Write the fragments directly rather than joining them into one string
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(html)
+            f.writelines(parts)
         
         return path
     
@@ -201,46 +232,36 @@ class HTMLReport(BaseReport):
         if not self._article.claims:
             return '<p style="color: #7f8c8d;">No claims detected.</p>'
         
-        html_parts = []
-        for claim in self._article.claims:
-            claim_text = claim.get('text', 'Unknown claim')
-            html_parts.append(f'<div class="claim-item">{claim_text}</div>')
-        
-        return '\n'.join(html_parts)
+        return '\n'.join(
+            f'<div class="claim-item">{_esc(claim.get("text", "Unknown claim"))}</div>'
+            for claim in self._article.claims
+        )
     
     def _generate_citation_html(self) -> str:
         """Generate HTML for citations list."""
         if not self._citations:
             return '<p style="color: #7f8c8d;">No citations found.</p>'
         
-        html_parts = []
-        for citation in self._citations:
-            # If it's a URL, make it clickable
-            if citation.startswith('http'):
-                html_parts.append(
-                    f'<div class="citation-item">'
-                    f'<a href="{citation}" target="_blank">{citation}</a>'
-                    f'</div>'
-                )
-            else:
-                html_parts.append(f'<div class="citation-item">"{citation}"</div>')
-        
-        return '\n'.join(html_parts)
+        # URLs are made clickable; quoted evidence is shown in quotes.
+        # Article text is untrusted, so every citation is escaped once.
+        return '\n'.join(
+            f'<div class="citation-item">'
+            f'<a href="{cite}" target="_blank">{cite}</a>'
+            f'</div>'
+            if cite.startswith('http') else
+            f'<div class="citation-item">"{cite}"</div>'
+            for cite in map(_esc, self._citations)
+        )
     
     def _generate_mismatch_html(self) -> str:
         """Generate HTML for glossary mismatches."""
         if not self._mismatches:
             return '<p style="color: #2ecc71;">✓ No glossary mismatches detected.</p>'
         
-        html_parts = []
-        for term, status in self._mismatches:
-            html_parts.append(
-                f'<div class="mismatch-item">'
-                f'<strong>{term}</strong>: {status}'
-                f'</div>'
-            )
-        
-        return '\n'.join(html_parts)
+        return '\n'.join(
+            f'<div class="mismatch-item"><strong>{_esc(term)}</strong>: {_esc(status)}</div>'
+            for term, status in self._mismatches
+        )
     
     def summary(self):
         """
@@ -4,9 +4,27 @@ json_report.py
 JSON format report implementation with detailed metadata.
 """
 import json
+import math
 from datetime import datetime
 from src.base_report import BaseReport
 
+try:
+    import orjson  # optional: C-backed encoder, used when installed
+except ImportError:
+    orjson = None
+
+
+
+def _orjson_float_matches(value: float) -> bool:
+    """
+    Return True if orjson writes value exactly as json does.
+
+    orjson writes NaN/Infinity as null and spells exponents differently
+    (1e16, 0.00001 for json's 1e+16, 1e-05), so scores holding such floats
+    are written by json instead.
+    """
+    return math.isfinite(value) and "e" not in repr(value)
+
 
 class JSONReport(BaseReport):
     """
@@ -18,27 +36,35 @@ class JSONReport(BaseReport):
     - Machine-readable outputs
     """
     
-    def export(self, path: str = "report_output.json") -> str:
+    __slots__ = ()
+    
+    def export(self, path: str = "report_output.json", timestamp: str = None) -> str:
         """
         Export complete analysis to JSON with timestamp and metadata.
         
         Args:
             path (str): Output JSON file path
+            timestamp (str): ISO timestamp to record; pass one value to every
+                             report in a batch to avoid a clock read per report.
+                             Defaults to the current time.
             
         Returns:
             str: Path to the exported JSON file
         """
+        ctx = self._context()
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         data = {
             "metadata": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "analyzer_version": "1.0.0",
                 "format": "JSON"
             },
             "article": {
-                "domain": self._article.domain,
-                "text_preview": self._article.text[:200] + "..." if len(self._article.text) > 200 else self._article.text,
-                "text_length": len(self._article.text),
-                "clean_text_length": len(self._article.clean_text) if self._article.clean_text else 0
+                "domain": ctx["domain"],
+                "text_preview": ctx["preview"],
+                "text_length": ctx["text_len"],
+                "clean_text_length": ctx["clean_text_len"]
             },
             "analysis": {
                 "risk_score": self._score,
@@ -49,30 +75,49 @@ class JSONReport(BaseReport):
                     {"term": term, "status": status} 
                     for term, status in self._mismatches
                 ],
-                "evidence_map": self._evidence_map
+                "evidence_map": self.evidence_map
             },
             "summary": {
-                "total_claims": len(self._article.claims),
-                "total_citations": len(self._citations),
-                "total_mismatches": len(self._mismatches),
+                "total_claims": ctx["n_claims"],
+                "total_citations": ctx["n_citations"],
+                "total_mismatches": ctx["n_mismatches"],
                 "risk_total": self._score.get("total", 0)
             }
         }
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        encoded = None
+        if orjson is not None and all(
+            _orjson_float_matches(v) for v in self._score.values() if isinstance(v, float)
+        ):
+            try:
+                encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                pass  # e.g. non-str keys or ints beyond 64 bits, which json accepts
+        
+        if encoded is not None:
+            # orjson emits UTF-8 bytes directly; write them without re-encoding
+            with open(path, 'wb') as f:
+                f.write(encoded)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         
         return path
     
-    def summary(self):
+    def summary(self, timestamp: str = None):
         """
         Return JSON-specific summary with additional metadata.
+        
+        Args:
+            timestamp (str): ISO timestamp to record (defaults to now)
         """
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         base_summary = super().summary()
         base_summary.update({
             "format": "JSON",
             "risk_level": self.get_risk_level(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "machine_readable": True
         })
         return base_summary
@@ -16,12 +16,108 @@ Tiers:
 from __future__ import annotations
 
 import csv
+import functools
+import itertools
+import os
 import re
-import uuid
 from datetime import datetime
+from multiprocessing import parent_process
 from typing import Optional, Literal
 
 
+# Abbreviations whose trailing period does not end a sentence.
+_ABBREVIATIONS = ("dr.", "mr.", "mrs.", "ms.", "prof.", "st.", "vs.", "e.g.", "i.e.", "u.s.", "u.k.", "fig.", "approx.")
+
+# Patterns used on every article are compiled once at import time.
+_SENT_SPLIT_RE = re.compile(
+    r"(?<=[.!?])"
+    + "".join(rf"(?<!\b{re.escape(abbr)})" for abbr in _ABBREVIATIONS)
+    + r"\s+",
+    re.I,
+)
+_URL_RE = re.compile(r"https?://[^\s)]+", re.I)
+_QUOTE_RE = re.compile(r'"([^"]{3,})"')
+# <script>/<style> blocks (contents included) or any other single tag
+_STRIP_RE = re.compile(r"(?is)<(script|style)\b[^>]*>.*?</\1\s*>|<[^>]+>")
+
+# Characters that make csv.writer quote a field (default excel dialect)
+_CSV_SPECIAL_RE = re.compile(r'[",\r\n]')
+
+# Drops the BOM and turns non-breaking spaces into plain spaces.
+_NORMALIZE_TABLE = str.maketrans({"\ufeff": "", "\xa0": " "})
+
+_URL_SCHEMES = frozenset({"http", "https", "file"})
+
+# Term tuples are ordered most common first: the regex engine tries
+# alternatives left to right, so frequent terms resolve a position soonest.
+_CLICKBAIT_TERMS = (
+    "breakthrough",
+    "miracle",
+    "shocking",
+    "guaranteed",
+    "instantly",
+    "cure-all",
+    "secret revealed",
+    "you won't believe",
+)
+_ABSOLUTE_TERMS = (
+    "always",
+    "never",
+    "prevents",
+    "cures",
+    "proves",
+    "guaranteed",
+    "zero risk",
+    "works for everyone",
+)
+
+
+def _term_pattern(terms) -> re.Pattern:
+    """Compile literal terms, in order, into one case-insensitive alternation."""
+    return re.compile("|".join(map(re.escape, terms)), re.I)
+
+
+_CLAIM_KEYWORDS = (
+    "reduce",
+    "increase",
+    "improve",
+    "cause",
+    "prevent",
+    "cure",
+    "reduces",
+    "improves",
+)
+
+# One regex scan per text instead of one substring search per term.
+_CLICKBAIT_RE = _term_pattern(_CLICKBAIT_TERMS)
+_ABSOLUTE_RE = _term_pattern(_ABSOLUTE_TERMS)
+_CLAIM_RE = _term_pattern(_CLAIM_KEYWORDS + _ABSOLUTE_TERMS)
+
+# Source of claim IDs; cheaper than generating a UUID per claim. Child
+# processes prefix their IDs with their PID, and batch workers also with a
+# per-batch token, so a PID reused by a later batch cannot repeat an ID.
+_claim_prefix = "c" if parent_process() is None else f"c{os.getpid()}-"
+_claim_counter = itertools.count(1)
+
+
+def _reset_claim_ids(batch: str = ""):
+    """
+    Give the current (worker) process its own claim ID namespace.
+
+    Runs automatically in forked children. Spawned and forkserver workers
+    import this module before they know they are children, so pool
+    initializers (see analyzer._init_worker) must call it explicitly,
+    passing a token unique to their batch.
+    """
+    global _claim_prefix, _claim_counter
+    _claim_prefix = f"c{batch}-{os.getpid()}-" if batch else f"c{os.getpid()}-"
+    _claim_counter = itertools.count(1)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_claim_ids)
+
+
 # =========================== SIMPLE FUNCTIONS =========================== #
 
 
@@ -43,9 +139,13 @@ def normalize_whitespace(text: str) -> str:
     """
     if not isinstance(text, str):
         raise TypeError("text must be a string")
-    # Remove BOM and non-breaking space; collapse whitespace
-    cleaned = text.replace("\ufeff", "").replace("\xa0", " ")
-    return " ".join(cleaned.split())
+    # isprintable() rejects every whitespace character except " " (and the
+    # BOM), so single-spaced text without edge spaces is already normalized.
+    if (text.isprintable() and "  " not in text
+            and text[:1] != " " and text[-1:] != " "):
+        return text
+    # Remove BOM and non-breaking space in one pass; collapse whitespace
+    return " ".join(text.translate(_NORMALIZE_TABLE).split())
 
 
 def validate_nonempty_str(value: str, name: str = "value") -> str:
@@ -97,6 +197,12 @@ def parse_iso_date_safe(date_str: Optional[str]) -> Optional[datetime]:
     s = date_str.strip()
     if not s:
         return None
+    return _parse_iso(s)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(s: str) -> Optional[datetime]:
+    """Parse a stripped ISO string; cached since articles often share timestamps."""
     try:
         # Try exact first; if only date, datetime.fromisoformat still works
         return datetime.fromisoformat(s if "T" in s else f"{s}T00:00:00")
@@ -124,18 +230,7 @@ def is_clickbait_phrase(text: str) -> bool:
     """
     if not isinstance(text, str):
         raise TypeError("text must be a string")
-    clickbait_terms = {
-        "miracle",
-        "you won't believe",
-        "cure-all",
-        "secret revealed",
-        "instantly",
-        "breakthrough",
-        "guaranteed",
-        "shocking",
-    }
-    lower = text.lower()
-    return any(term in lower for term in clickbait_terms)
+    return _CLICKBAIT_RE.search(text) is not None
 
 
 def is_absolute_language(text: str) -> bool:
@@ -158,18 +253,7 @@ def is_absolute_language(text: str) -> bool:
     """
     if not isinstance(text, str):
         raise TypeError("text must be a string")
-    absolute_terms = {
-        "always",
-        "never",
-        "guaranteed",
-        "proves",
-        "prevents",
-        "cures",
-        "works for everyone",
-        "zero risk",
-    }
-    t = text.lower()
-    return any(word in t for word in absolute_terms)
+    return _ABSOLUTE_RE.search(text) is not None
 
 
 # ============================ MEDIUM FUNCTIONS ========================== #
@@ -194,11 +278,29 @@ def extract_domain(url: str) -> str:
     """
     if not isinstance(url, str):
         raise TypeError("url must be a string")
-    match = re.match(r"^(?:https?|file)://([^/]+)", url.strip(), flags=re.I)
-    if not match:
+    host = _parse_host(url)
+    if host is None:
         raise ValueError(f"Invalid URL: {url}")
-    host = match.group(1).split("@")[-1].split(":")[0]
-    return host.lower()
+    return host
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_host(url: str) -> Optional[str]:
+    """Return the lowercased host of `url`, or None if it is not a valid URL.
+
+    A plain string scan (no regex, no urllib.parse) cached per URL, since many
+    articles come from the same sources.
+    """
+    s = url.strip()
+    sep = s.find("://")
+    if sep < 0 or s[:sep].lower() not in _URL_SCHEMES:
+        return None
+    start = sep + 3
+    end = s.find("/", start)
+    authority = s[start:] if end < 0 else s[start:end]
+    if not authority:
+        return None
+    return authority.rsplit("@", 1)[-1].split(":", 1)[0].lower()
 
 
 def extract_text_blocks(html_or_text: str) -> str:
@@ -225,14 +327,15 @@ def extract_text_blocks(html_or_text: str) -> str:
     if "<" not in raw:
         return normalize_whitespace(raw)
     # Super-lightweight HTML stripper (OK for Project 1)
-    text = re.sub(r"(?is)<(script|style)[^>]*>.*?</\\1>", " ", raw)
-    text = re.sub(r"(?s)<[^>]+>", " ", text)
-    return normalize_whitespace(text)
+    return normalize_whitespace(_STRIP_RE.sub(" ", raw))
 
 
 def find_claim_sentences(text: str, min_len: int = 40) -> list[dict]:
     """Find sentences that likely make health claims.
 
+    Sentences are split on terminal punctuation, except after common
+    abbreviations such as "Dr." or "U.S.".
+
     Heuristic:
     - sentence length >= `min_len`
     - contains action words (cause/prevent/cure/…)
@@ -252,6 +355,8 @@ def find_claim_sentences(text: str, min_len: int = 40) -> list[dict]:
     Examples:
         >>> find_claim_sentences('Coffee cures headaches. It tastes good.', 20)[0]['text']
         'Coffee cures headaches.'
+        >>> find_claim_sentences('Dr. Lee says coffee cures headaches.', 20)[0]['text']
+        'Dr. Lee says coffee cures headaches.'
     """
     if not isinstance(text, str):
         raise TypeError("text must be a string")
@@ -260,17 +365,14 @@ def find_claim_sentences(text: str, min_len: int = 40) -> list[dict]:
     if min_len < 1:
         raise ValueError("min_len must be >= 1")
 
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-    keywords = {"cause", "prevent", "cure", "reduces", "reduce", "increase", "improves", "improve"}
-    claims: list[dict] = []
-    for s in sentences:
-        clean = s.strip()
-        if not clean:
-            continue
-        low = clean.lower()
-        if len(clean) >= min_len and (any(k in low for k in keywords) or is_absolute_language(clean)):
-            claims.append({"id": str(uuid.uuid4()), "text": clean})
-    return claims
+    # Splitting, stripping and matching all run in C; action words and
+    # absolute language share one pattern (_CLAIM_RE).
+    search = _CLAIM_RE.search
+    return [
+        {"id": f"{_claim_prefix}{next(_claim_counter)}", "text": clean}
+        for clean in map(str.strip, _SENT_SPLIT_RE.split(text))
+        if len(clean) >= min_len and search(clean)
+    ]
 
 
 def collect_citations(text: str) -> list[str]:
@@ -291,20 +393,40 @@ def collect_citations(text: str) -> list[str]:
     """
     if not isinstance(text, str):
         raise TypeError("text must be a string")
-    urls = re.findall(r"https?://[^\s)]+", text, flags=re.I)
-    quotes = re.findall(r'"([^"]{3,})"', text)
-    return urls + quotes
+    # Plain substring checks let text without URLs or quotes skip the regex scans.
+    # Quotes are appended to the URL list in place; no third list is built.
+    citations = _URL_RE.findall(text) if "://" in text else []
+    if '"' in text:
+        citations.extend(_QUOTE_RE.findall(text))
+    return citations
+
+
+@functools.lru_cache(maxsize=8)
+def _canon_glossary(items: tuple) -> tuple:
+    """Lowercase a frozenset-valued glossary's terms and phrases once."""
+    return tuple(
+        (term, term.lower(), tuple(phrase.lower() for phrase in allowed))
+        for term, allowed in items
+    )
 
 
-def compare_to_glossary(text: str, glossary: dict[str, set[str]]) -> list[tuple[str, str]]:
+def compare_to_glossary(
+    text: str,
+    glossary: dict[str, set[str]],
+    text_lower: Optional[str] = None,
+) -> list[tuple[str, str]]:
     """Compare text to glossary and flag mismatched phrasing.
 
     Very light MVP: If a term appears in the text but none of its allowed
     phrases are present, record a (term, 'mismatch') tuple.
 
+    Glossaries whose values are all frozensets are hashable, so their
+    lowercased form is cached and reused across calls.
+
     Args:
         text: Article text.
         glossary: e.g., {"flu": {"may reduce risk", "can help"}}
+        text_lower: `text` already lowercased by the caller, if available.
 
     Returns:
         List of (term, 'mismatch') pairs.
@@ -321,10 +443,18 @@ def compare_to_glossary(text: str, glossary: dict[str, set[str]]) -> list[tuple[
     if not isinstance(glossary, dict):
         raise TypeError("glossary must be a dict[str, set[str]]")
 
-    lower = text.lower()
+    lower = text.lower() if text_lower is None else text_lower
+    items = tuple(glossary.items())
+    if all(isinstance(allowed, frozenset) for _, allowed in items):
+        return [
+            (term, "mismatch")
+            for term, term_lower, allowed in _canon_glossary(items)
+            if term_lower in lower and not any(p in lower for p in allowed)
+        ]
+
     mismatches: list[tuple[str, str]] = []
-    for term, allowed in glossary.items():
-        if not isinstance(allowed, set):
+    for term, allowed in items:
+        if not isinstance(allowed, (set, frozenset)):
             raise TypeError("glossary values must be sets of strings")
         if term.lower() in lower:
             if not any(phrase.lower() in lower for phrase in allowed):
@@ -361,7 +491,7 @@ def score_article(
 
     Examples:
         >>> score_article('Coffee cures pain.', [{'id': '1', 'text': 'Coffee cures pain.'}], [], [])
-        {'clickbait': 0, 'absolute': 0, 'no_evidence': 1, 'mismatch': 0, 'total': 1}
+        {'clickbait': 0, 'absolute': 1, 'no_evidence': 1, 'mismatch': 0, 'total': 2}
     """
     if not isinstance(text, str):
         raise TypeError("text must be a string")
@@ -372,8 +502,27 @@ def score_article(
     if not isinstance(mismatches, list):
         raise TypeError("mismatches must be a list")
 
-    clickbait = 1 if is_clickbait_phrase(text) else 0
-    absolute = sum(1 for c in claims if isinstance(c, dict) and is_absolute_language(c.get("text", "")))
+    return _score_components(text, claims, citations, mismatches)
+
+
+def _score_components(
+    text: str,
+    claims: list[dict],
+    citations: list[str],
+    mismatches: list[tuple[str, str]],
+    claim_texts: Optional[list[str]] = None,
+) -> dict:
+    """Compute the `score_article` breakdown for inputs that are already validated.
+
+    Callers that check their inputs up front (e.g. `RiskScorer`) use this
+    directly to skip repeating the type checks on every calculation.
+    `claim_texts`, when given, must be the texts of `claims` in order (as
+    kept by `Article.claim_texts`); it saves re-extracting them per score.
+    """
+    clickbait = 1 if text and is_clickbait_phrase(text) else 0
+    if claim_texts is None:
+        claim_texts = [c.get("text", "") for c in claims if isinstance(c, dict)]
+    absolute = _count_absolute(claim_texts)
     no_evidence = len(claims) if not citations else 0
     mismatch = len(mismatches)
 
@@ -387,6 +536,15 @@ def score_article(
     }
 
 
+def _count_absolute(texts: list[str]) -> int:
+    """Count texts containing absolute language.
+
+    The per-text loop runs in C (map over the compiled pattern's search)
+    rather than calling `is_absolute_language` once per claim.
+    """
+    return sum(map(bool, map(_ABSOLUTE_RE.search, texts)))
+
+
 def build_claim_evidence_map(claims: list[dict], citations: list[str]) -> dict[str, list[str]]:
     """Link each claim to a small set of likely-relevant evidence.
 
@@ -405,14 +563,82 @@ def build_claim_evidence_map(claims: list[dict], citations: list[str]) -> dict[s
         >>> build_claim_evidence_map([{'id': '1', 'text': 'Coffee helps focus'}], ['https://ref'])
         {'1': ['https://ref']}
     """
-    mapping: dict[str, list[str]] = {}
+    return {cid: related for cid, _, related in _claim_evidence(claims, citations)}
+
+
+def _claim_evidence(claims: list[dict], citations: list[str]):
+    """Yield (claim id, claim text, evidence list) for each claim.
+
+    The per-claim core of `build_claim_evidence_map`, shared with
+    `_score_and_map`. Each citation is lowercased once, the citations are
+    scanned once per distinct head word (claims often share one), and every
+    claim gets its own list.
+    """
+    lowered = [(cite.lower(), cite) for cite in citations]
+    by_head: dict[str, list[str]] = {}
     for c in claims:
-        cid = c.get("id", "")
         ctext = c.get("text", "")
         head = (ctext.split() or [""])[0].lower()
-        related = [cite for cite in citations if head and head in cite.lower()]
-        mapping[cid] = related if related else (citations[:1] if citations else [])
-    return mapping
+        related = by_head.get(head)
+        if related is None:
+            related = [cite for low, cite in lowered if head in low] if head else []
+            related = by_head[head] = related if related else list(citations[:1])
+        yield c.get("id", ""), ctext, list(related)
+
+
+def score_and_map(
+    text: str,
+    claims: list[dict],
+    citations: list[str],
+    mismatches: list[tuple[str, str]],
+) -> tuple[dict, dict[str, list[str]]]:
+    """Score an article and map its claims to evidence in one pass over claims.
+
+    Equivalent to calling `score_article` and `build_claim_evidence_map`,
+    but each claim's text is read once for both results.
+
+    Args:
+        text: Full article text.
+        claims: Detected claim dicts.
+        citations: Evidence links/quotes.
+        mismatches: Glossary mismatches.
+
+    Returns:
+        (risk breakdown dict, map of claim_id -> list of evidence strings).
+
+    Raises:
+        TypeError: If inputs are wrong types.
+
+    Examples:
+        >>> score, evidence = score_and_map('Coffee cures pain.', [{'id': '1', 'text': 'Coffee cures pain.'}], [], [])
+        >>> score['total'], evidence
+        (2, {'1': []})
+    """
+    if not isinstance(text, str):
+        raise TypeError("text must be a string")
+    if not isinstance(claims, list):
+        raise TypeError("claims must be a list")
+    if not isinstance(citations, list):
+        raise TypeError("citations must be a list")
+    if not isinstance(mismatches, list):
+        raise TypeError("mismatches must be a list")
+
+    return _score_and_map(text, claims, citations, mismatches)
+
+
+def _score_and_map(
+    text: str,
+    claims: list[dict],
+    citations: list[str],
+    mismatches: list[tuple[str, str]],
+) -> tuple[dict, dict[str, list[str]]]:
+    """`score_and_map` for inputs that are already validated."""
+    mapping: dict[str, list[str]] = {}
+    claim_texts: list[str] = []
+    for cid, ctext, related in _claim_evidence(claims, citations):
+        mapping[cid] = related
+        claim_texts.append(ctext)
+    return _score_components(text, claims, citations, mismatches, claim_texts), mapping
 
 
 def export_flagged_claims(
@@ -440,11 +666,27 @@ def export_flagged_claims(
     if not isinstance(output_path, str):
         raise TypeError("output_path must be a string")
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
+    # Stringify the score once rather than letting csv convert it per row
+    total = score.get("total", 0)
+    total = "" if total is None else f"{total}"  # csv writes None as ""
+    special = _CSV_SPECIAL_RE.search
+
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["Claim ID", "Claim Text", "Total Risk Score"])
+        if special(total):
+            writer.writerows((c.get("id", ""), c.get("text", ""), total) for c in claims)
+            return output_path
+        write = f.write
         for c in claims:
-            writer.writerow([c.get("id", ""), c.get("text", ""), score.get("total", 0)])
+            cid = c.get("id", "")
+            text = c.get("text", "")
+            # Rows of plain strings need no quoting, so they skip the csv module
+            if (type(cid) is str and type(text) is str
+                    and special(cid) is None and special(text) is None):
+                write(f"{cid},{text},{total}\r\n")
+            else:
+                writer.writerow((cid, text, total))
     return output_path
 
 
@@ -495,47 +737,6 @@ def cli_search_and_highlight(query: str, corpus: list[str]) -> list[str]:
         if not isinstance(text, str):
             continue
         if pattern.search(text):
-            results.append(pattern.sub(r"**\\1**", text))
+            results.append(pattern.sub(r"**\1**", text))
     return results
 
-
-
-# 2 - Re-export key functions so you can do: from src import find_claim_sentences, ...
-from .misinfo_library import (
-    normalize_whitespace,
-    validate_nonempty_str,
-    parse_iso_date_safe,
-    is_clickbait_phrase,
-    is_absolute_language,
-    extract_domain,
-    extract_text_blocks,
-    find_claim_sentences,
-    collect_citations,
-    compare_to_glossary,
-    score_article,
-    build_claim_evidence_map,
-    export_flagged_claims,
-    summarize_trends,
-    cli_search_and_highlight,
-)
-
-__all__ = [
-    "normalize_whitespace",
-    "validate_nonempty_str",
-    "parse_iso_date_safe",
-    "is_clickbait_phrase",
-    "is_absolute_language",
-    "extract_domain",
-    "extract_text_blocks",
-    "find_claim_sentences",
-    "collect_citations",
-    "compare_to_glossary",
-    "score_article",
-    "build_claim_evidence_map",
-    "export_flagged_claims",
-    "summarize_trends",
-    "cli_search_and_highlight",
-]
-
-__version__ = "0.1.0"
-
@@ -0,0 +1,192 @@
+"""
+persistence.py
+
+Saving and loading analysis results between sessions as JSON files.
+"""
+import json
+import mmap
+import os
+from pathlib import Path
+
+try:
+    import orjson  # optional: C-backed encoder/decoder, used when installed
+except ImportError:
+    orjson = None
+
+
+# Items of a large list encoded per orjson call while streaming.
+_STREAM_BATCH = 1024
+
+
+def _dumps(value, pad: bytes = b"") -> bytes:
+    """Encode value with orjson, indented as if nested under pad."""
+    encoded = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    # JSON strings never contain raw newlines, so this only touches indents
+    return encoded.replace(b"\n", b"\n" + pad) if pad else encoded
+
+
+def _list_chunks(items: list, pad: bytes = b""):
+    """Yield a list's encoding _STREAM_BATCH items at a time."""
+    sep = b"["
+    for start in range(0, len(items), _STREAM_BATCH):
+        # Drop each batch's own "[" and trailing "\n<pad>]"
+        yield sep + _dumps(items[start:start + _STREAM_BATCH], pad)[1:-2 - len(pad)]
+        sep = b","
+    yield b"\n" + pad + b"]"
+
+
+def _orjson_chunks(data):
+    """
+    Yield the orjson OPT_INDENT_2 encoding of data piece by piece.
+
+    Large lists, whether top-level or a value of a top-level dict (e.g. the
+    "articles" of {"articles": [...], "summary": {...}}), are encoded
+    _STREAM_BATCH items at a time, so memory stays bounded by one batch
+    rather than the whole document. Output is identical to a single
+    orjson.dumps call.
+    """
+    if isinstance(data, list) and len(data) > _STREAM_BATCH:
+        yield from _list_chunks(data)
+        return
+    if not (isinstance(data, dict) and data
+            and all(isinstance(key, str) for key in data)):
+        yield _dumps(data)
+        return
+
+    sep = b"{"
+    pending = {}  # small values, encoded together in one call
+    for key, value in data.items():
+        if isinstance(value, list) and len(value) > _STREAM_BATCH:
+            if pending:
+                yield sep + _dumps(pending)[1:-2]
+                sep = b","
+                pending = {}
+            yield sep + b"\n  " + orjson.dumps(key) + b": "
+            yield from _list_chunks(value, b"  ")
+            sep = b","
+        else:
+            pending[key] = value
+            if len(pending) == _STREAM_BATCH:
+                yield sep + _dumps(pending)[1:-2]
+                sep = b","
+                pending = {}
+    if pending:
+        yield sep + _dumps(pending)[1:-2]
+    yield b"\n}"
+
+
+class PersistenceManager:
+    """
+    Saves analysis results to disk and loads them back.
+
+    Results are stored as indented UTF-8 JSON. orjson is used when it is
+    installed, falling back to the standard library json module for data
+    orjson rejects (non-str dict keys, ints beyond 64 bits). The two
+    encoders load back to the same values with two exceptions: orjson
+    writes NaN and Infinity as null, and it spells float exponents
+    without a sign or padding (1e16 rather than 1e+16). Results that may
+    contain non-finite floats should replace them before saving.
+    """
+
+    @staticmethod
+    def save_results(data, path) -> str:
+        """
+        Save results to a JSON file.
+
+        Args:
+            data: JSON-serializable results (usually a dict); see the class
+                  docstring for how NaN and Infinity are stored
+            path (str or Path): Output file path
+
+        Returns:
+            str: Path to the saved file
+
+        Raises:
+            TypeError: If data cannot be serialized to JSON
+            RuntimeError: If the file cannot be written
+        """
+        path = Path(path)
+        # Written beside the target and renamed into place, so a failed save
+        # never leaves a truncated results file behind.
+        partial = path.with_name(path.name + ".partial")
+        try:
+            try:
+                encoded = False
+                if orjson is not None:
+                    try:
+                        with partial.open("wb") as f:
+                            f.writelines(_orjson_chunks(data))
+                        encoded = True
+                    except TypeError:
+                        pass  # e.g. int dict keys, which json accepts
+                if not encoded:
+                    with partial.open("w", encoding="utf-8") as f:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
+                os.replace(partial, path)
+            except BaseException:
+                partial.unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            raise RuntimeError(f"could not save results to {path}: {e}") from e
+        return str(path)
+
+    @staticmethod
+    def save_batch(reports: list, path) -> str:
+        """
+        Save the summaries of many reports as one JSON array.
+
+        Summaries are encoded in large batches and streamed to disk, so
+        the whole array is never held as a single encoded document.
+        load_results() reads the file back as a list of summary dicts.
+
+        Args:
+            reports (list): BaseReport instances, e.g. Analyzer.reports
+            path (str or Path): Output file path
+
+        Returns:
+            str: Path to the saved file
+
+        Raises:
+            TypeError: If reports is not a list
+            RuntimeError: If the file cannot be written
+        """
+        if not isinstance(reports, list):
+            raise TypeError("reports must be a list")
+        return PersistenceManager.save_results(
+            [report.summary() for report in reports],
+            path
+        )
+
+    @staticmethod
+    def load_results(path):
+        """
+        Load results previously written by save_results().
+
+        Args:
+            path (str or Path): JSON file path
+
+        Returns:
+            The stored results (usually a dict)
+
+        Raises:
+            RuntimeError: If the file is missing, unreadable, or not valid JSON
+        """
+        path = Path(path)
+        try:
+            with path.open("rb") as f:
+                if orjson is not None and os.fstat(f.fileno()).st_size:
+                    # orjson parses straight from the mapped pages, so the
+                    # file is never copied into an intermediate bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                            memoryview(mm) as view:
+                        try:
+                            return orjson.loads(view)
+                        except orjson.JSONDecodeError:
+                            # json also reads NaN/Infinity, as written by
+                            # the json fallback in save_results()
+                            return json.loads(bytes(view))
+                return json.loads(f.read())
+        except OSError as e:
+            raise RuntimeError(f"could not load results from {path}: {e}") from e
+        except ValueError as e:  # includes JSON and UTF-8 decode errors
+            raise RuntimeError(f"corrupted results file {path}: {e}") from e
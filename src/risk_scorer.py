@@ -1,4 +1,27 @@
-from src.misinfo_library import score_article, build_claim_evidence_map
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+
+from src.misinfo_library import (
+    _score_and_map,
+    _score_components,
+    build_claim_evidence_map,
+)
+
+# Score breakdowns memoized by the inputs they depend on, least recently
+# used first. Articles with identical claim texts (and the many empty ones)
+# are scored once; the lock keeps the LRU bookkeeping safe across threads.
+_SCORE_CACHE = OrderedDict()
+_SCORE_CACHE_SIZE = 1024
+_SCORE_CACHE_LOCK = threading.Lock()
+
+# Shared read-only stand-in for "no claims/citations/mismatches"; scorers
+# never mutate their inputs, so one tuple can replace a fresh [] per call.
+EMPTY_CLAIMS = ()
+
+# Totals below 1 are Low, below 3 Medium, otherwise High.
+_RISK_THRESHOLDS = (1, 3)
+_RISK_LABELS = ("Low", "Medium", "High")
 
 
 class RiskScorer:
@@ -6,58 +29,139 @@ class RiskScorer:
     Scores misinformation risk based on claims, citations, and glossary mismatches.
     """
 
-    def __init__(self, claims: list, citations: list, mismatches: list):
-        if not isinstance(claims, list):
-            raise TypeError("claims must be a list")
-        if not isinstance(citations, list):
-            raise TypeError("citations must be a list")
-        if not isinstance(mismatches, list):
-            raise TypeError("mismatches must be a list")
-
-        self._claims = claims
-        self._citations = citations
-        self._mismatches = mismatches
+    __slots__ = (
+        "_claims",
+        "_claim_texts",
+        "_citations",
+        "_mismatches",
+        "_score",
+        "_risk_level",
+        "_evidence_map",
+        "_n_claims",
+        "_n_citations",
+    )
+
+    def __init__(self, claims: list, citations: list, mismatches: list,
+                 claim_texts: list = None):
+        self.reset(claims, citations, mismatches, claim_texts)
+
+    @classmethod
+    def _from_trusted(cls, claims: list, citations: list, mismatches: list,
+                      claim_texts: list = None):
+        """
+        Build a scorer without type-checking its inputs.
 
-        self._score = None
-        self._evidence_map = None
+        For internal callers such as Analyzer whose lists come straight from
+        an Article and a Glossary and are therefore known to be lists.
+        """
+        scorer = cls.__new__(cls)
+        scorer._assign(claims, citations, mismatches, claim_texts)
+        return scorer
 
     # ---------------- Properties ----------------
 
     @property
     def score(self):
+        """Return the score breakdown, calculating it on first access."""
+        if self._score is None:
+            self.calculate()
         return self._score
 
     @property
     def evidence_map(self):
+        """Return the claim → evidence map, building it on first access."""
+        if self._evidence_map is None:
+            self.build_evidence_map()
         return self._evidence_map
 
     @property
     def risk_level(self) -> str:
+        """Return "Low", "Medium" or "High"; classified once per score."""
         if self._score is None:
-            return "Not calculated"
+            self.calculate()
+        return self._risk_level
 
-        total = self._score.get("total", 0)
+    # ---------------- Methods ----------------
 
-        if total < 1:
-            return "Low"
-        elif total < 3:
-            return "Medium"
-        return "High"
+    def reset(self, claims: list, citations: list, mismatches: list,
+              claim_texts: list = None):
+        """
+        Point the scorer at a new article's data and clear previous results.
 
-    # ---------------- Methods ----------------
+        Lets one RiskScorer be reused across many articles instead of
+        allocating a new instance per article.
+
+        Args:
+            claims (list or tuple): claim dicts {'id', 'text'}
+            citations (list or tuple): extracted citations
+            mismatches (list or tuple): glossary mismatches
+            claim_texts (list or tuple): the claims' texts in order, if
+                                         already extracted (e.g. Article.claim_texts)
+        """
+        if not isinstance(claims, (list, tuple)):
+            raise TypeError("claims must be a list or tuple")
+        if not isinstance(citations, (list, tuple)):
+            raise TypeError("citations must be a list or tuple")
+        if not isinstance(mismatches, (list, tuple)):
+            raise TypeError("mismatches must be a list or tuple")
+        if claim_texts is not None and not isinstance(claim_texts, (list, tuple)):
+            raise TypeError("claim_texts must be a list or tuple")
+        self._assign(claims, citations, mismatches, claim_texts)
+
+    def _assign(self, claims: list, citations: list, mismatches: list,
+                claim_texts: list = None):
+        """Store new inputs and clear previous results; reset() minus the checks."""
+        self._claims = claims
+        self._claim_texts = claim_texts
+        self._citations = citations
+        self._mismatches = mismatches
+        self._n_claims = len(claims)  # for __repr__
+        self._n_citations = len(citations)
+
+        self._score = None
+        self._risk_level = None
+        self._evidence_map = None
 
     def calculate(self):
         """
-        Calculate risk score using Project 1 score_article().
-        MATCHES YOUR FUNCTION SIGNATURE EXACTLY.
+        Calculate risk score using the Project 1 score_article() logic.
+
+        Inputs were type-checked in reset(), so this calls the scoring core
+        directly instead of re-validating them on every calculation. The
+        score depends only on the claim texts and the sizes of the three
+        lists, so results are memoized on those; each scorer gets its own
+        copy of the cached dict.
         """
-        self._score = score_article(
-            text="",                    # your function requires this
-            claims=self._claims,
-            citations=self._citations,
-            mismatches=self._mismatches
+        claim_texts = self._claim_texts
+        if claim_texts is None:
+            claim_texts = [
+                c.get("text", "") for c in self._claims if isinstance(c, dict)
+            ]
+        key = (
+            tuple(claim_texts),
+            len(self._claims),
+            not self._citations,
+            len(self._mismatches),
         )
 
+        with _SCORE_CACHE_LOCK:
+            cached = _SCORE_CACHE.get(key)
+            if cached is not None:
+                _SCORE_CACHE.move_to_end(key)
+        if cached is None:
+            cached = _score_components(
+                text="",                    # score_article() requires this
+                claims=self._claims,
+                citations=self._citations,
+                mismatches=self._mismatches,
+                claim_texts=claim_texts
+            )
+            with _SCORE_CACHE_LOCK:
+                _SCORE_CACHE[key] = cached
+                if len(_SCORE_CACHE) > _SCORE_CACHE_SIZE:
+                    _SCORE_CACHE.popitem(last=False)
+        self._set_score(dict(cached))
+
     def build_evidence_map(self):
         """
         Build claim → evidence mapping.
@@ -67,10 +171,32 @@ class RiskScorer:
             self._citations
         )
 
+    def compute_all(self):
+        """
+        Calculate the score and build the evidence map in a single pass.
+
+        Use this instead of calculate() + build_evidence_map() when both
+        results are needed; score and evidence_map compute only their own
+        result when accessed on their own.
+        """
+        score, self._evidence_map = _score_and_map(
+            "",
+            self._claims,
+            self._citations,
+            self._mismatches
+        )
+        self._set_score(score)
+
+    def _set_score(self, score: dict):
+        """Store a score breakdown and classify its risk level up front."""
+        self._score = score
+        total = score.get("total", 0)
+        self._risk_level = _RISK_LABELS[bisect_right(_RISK_THRESHOLDS, total)]
+
     # ---------------- String Methods ----------------
 
     def __str__(self):
-        return f"RiskScorer(score={self._score}, level={self.risk_level})"
+        return f"RiskScorer(score={self.score}, level={self.risk_level})"
 
     def __repr__(self):
-        return f"RiskScorer(claims={len(self._claims)}, citations={len(self._citations)})"
\ No newline at end of file
+        return f"RiskScorer(claims={self._n_claims}, citations={self._n_citations})"
\ No newline at end of file
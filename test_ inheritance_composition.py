@@ -3,9 +3,11 @@
 Comprehensive tests for OOP principles: Inheritance, Polymorphism, and Composition.
 Tests verify the proper implementation of object-oriented design patterns.
 """
+import gc
 import pytest
 import os
 import json
+import weakref
 from src.analyzer import Analyzer
 from src.article import Article
 from src.glossary import Glossary
@@ -27,10 +29,9 @@ class TestInheritance:
         assert issubclass(JSONReport, BaseReport)
         assert issubclass(HTMLReport, BaseReport)
     
-    def test_base_report_is_abstract(self):
+    def test_base_report_is_abstract(self, fresh_article):
         """Test that BaseReport cannot be instantiated directly."""
-        analyzer = Analyzer()
-        article = analyzer.add_article("Test article", "https://test.com")
+        article = fresh_article
         
         # Should raise TypeError because export() is not implemented
         with pytest.raises(TypeError):
@@ -61,10 +62,9 @@ class TestInheritance:
         assert callable(report.summary)
         assert callable(report.get_risk_level)
     
-    def test_method_overriding(self):
+    def test_method_overriding(self, fresh_article):
         """Test that child classes can override parent methods."""
-        analyzer = Analyzer()
-        article = analyzer.add_article("Test", "https://test.com")
+        article = fresh_article
         
         # Create different report types
         csv_report = CSVReport(article, {"total": 1}, [], [])
@@ -112,10 +112,9 @@ class TestInheritance:
 class TestPolymorphism:
     """Test polymorphic behavior - different objects responding to same interface."""
     
-    def test_all_reports_implement_export(self):
+    def test_all_reports_implement_export(self, fresh_article):
         """Test that all report types implement the export() method."""
-        analyzer = Analyzer()
-        article = analyzer.add_article("Test article text", "https://test.com")
+        article = fresh_article
         
         csv_report = CSVReport(article, {"total": 1}, [], [])
         json_report = JSONReport(article, {"total": 1}, [], [])
@@ -129,10 +128,9 @@ class TestPolymorphism:
         assert callable(json_report.export)
         assert callable(html_report.export)
     
-    def test_polymorphic_export_behavior(self):
+    def test_polymorphic_export_behavior(self, fresh_article):
         """Test that export() behaves differently for each report type."""
-        analyzer = Analyzer()
-        article = analyzer.add_article("Coffee always cures everything!", "https://test.com")
+        article = fresh_article
         
         # Create all three report types
         csv_report = CSVReport(article, {"total": 2}, [], [])
@@ -159,7 +157,40 @@ class TestPolymorphism:
         os.remove(json_path)
         os.remove(html_path)
     
-    def test_polymorphic_function_parameter(self):
+    def test_html_export_escapes_article_text(self):
+        """Test that article-derived text cannot inject markup into HTML."""
+        article = Article('Miracle <script>alert(1)</script> always cures "all <b>ills</b>".')
+        article.clean()
+        article.extract_claims(min_len=10)
+        article.extract_citations()
+        html_report = HTMLReport(article, {"total": 2}, [("<i>flu</i>", "mismatch")], article.citations)
+        
+        html_path = html_report.export("test_escape.html")
+        with open(html_path, encoding="utf-8") as f:
+            content = f.read()
+        os.remove(html_path)
+        
+        assert "<script>" not in content
+        assert "<b>" not in content and "<i>" not in content
+        assert "&lt;b&gt;ills&lt;/b&gt;" in content
+        assert "&lt;i&gt;flu&lt;/i&gt;" in content
+    
+    def test_json_export_accepts_any_json_score(self, fresh_article):
+        """Test that JSON export handles scores the json module accepts."""
+        score = {"total": float("nan"), 2: 3, "big": 2 ** 70, "huge": 1e16}
+        json_report = JSONReport(fresh_article, score, [], fresh_article.citations)
+        
+        json_path = json_report.export("test_json_score.json")
+        with open(json_path, encoding="utf-8") as f:
+            content = f.read()
+        os.remove(json_path)
+        
+        assert '"total": NaN' in content
+        assert '"2": 3' in content
+        assert '"huge": 1e+16' in content
+        assert json.loads(content)["analysis"]["risk_score"]["big"] == 2 ** 70
+    
+    def test_polymorphic_function_parameter(self, fresh_article):
         """Test that functions can accept any report type polymorphically."""
         def process_report(report: BaseReport) -> dict:
             """Function that accepts any BaseReport subclass."""
@@ -169,8 +200,7 @@ class TestPolymorphism:
                 "score": report.score.get("total", 0)
             }
         
-        analyzer = Analyzer()
-        article = analyzer.add_article("Miracle cure!", "https://test.com")
+        article = fresh_article
         
         # Create different report types
         csv_report = CSVReport(article, {"total": 3}, [], [])
@@ -187,10 +217,9 @@ class TestPolymorphism:
         assert json_result["risk"] == "High"
         assert html_result["risk"] == "High"
     
-    def test_liskov_substitution_principle(self):
+    def test_liskov_substitution_principle(self, fresh_article):
         """Test that any report subclass can replace BaseReport without breaking."""
-        analyzer = Analyzer()
-        article = analyzer.add_article("Test", "https://test.com")
+        article = fresh_article
         
         report_classes = [CSVReport, JSONReport, HTMLReport]
         
@@ -228,10 +257,54 @@ class TestPolymorphism:
         assert isinstance(report2, BaseReport)
         assert isinstance(report3, BaseReport)
     
-    def test_collection_of_different_report_types(self):
+    def test_report_switching_tracks_glossary_changes(self):
+        """Test that re-analyzing an article reflects glossary edits."""
+        analyzer = Analyzer(report_class=CSVReport)
+        article = analyzer.add_article("This vaccine always works.", "https://test.com")
+        
+        report1 = analyzer.analyze_article(article)
+        analyzer.set_report_format(JSONReport)
+        report2 = analyzer.analyze_article(article)
+        assert report2.score == report1.score
+        assert report2.score is not report1.score
+        
+        analyzer.glossary.add_term("vaccine", ["immunization"])
+        report3 = analyzer.analyze_article(article)
+        assert report3.mismatches == [("vaccine", "mismatch")]
+        assert report3.score["total"] == report1.score["total"] + 1
+    
+    def test_glossary_tracks_direct_term_edits(self):
+        """Test that terms added through Glossary.terms are matched."""
+        glossary = Glossary()
+        glossary.add_term("zz", ["approved"])
+        assert glossary.compare("ab zz") == [("zz", "mismatch")]
+        
+        terms = glossary.terms
+        glossary.compare("ab zz")
+        terms["a"] = frozenset()
+        assert glossary.compare("ab zz") == [("zz", "mismatch"), ("a", "mismatch")]
+        
+        terms["Flu"] = {"May Help"}
+        assert glossary.compare("flu shot") == [("Flu", "mismatch")]
+        terms["Flu"].add("Shot")
+        assert glossary.compare("flu shot") == []
+        
+        version = glossary.version
+        assert "zz" in glossary.terms
+        assert glossary.version == version
+        
+        terms["bad"] = ["not", "a", "set"]
+        with pytest.raises(TypeError):
+            glossary.compare("bad")
+        del terms["bad"]
+        
+        glossary.freeze()
+        with pytest.raises(TypeError):
+            glossary.terms["b"] = frozenset()
+    
+    def test_collection_of_different_report_types(self, fresh_article):
         """Test that we can store different report types in same collection."""
-        analyzer = Analyzer()
-        article = analyzer.add_article("Test", "https://test.com")
+        article = fresh_article
         
         # Create mixed collection of reports
         reports = [
@@ -339,10 +412,88 @@ class TestComposition:
         assert 'clickbait' in report.score
         assert 'absolute' in report.score
     
-    def test_composition_vs_inheritance(self):
-        """Test understanding: composition (HAS-A) vs inheritance (IS-A)."""
+    def test_tuple_inputs_give_list_evidence(self):
+        """Test that tuple citations still map claims to mutable lists."""
+        claims = [{"id": "1", "text": "Coffee cures pain"}]
+        assert RiskScorer(claims, (), ()).evidence_map == {"1": []}
+        
+        scorer = RiskScorer(claims, ("https://a.com", "https://b.com"), ())
+        scorer.evidence_map["1"].append("https://c.com")
+        assert scorer.evidence_map["1"] == ["https://a.com", "https://c.com"]
+    
+    def test_compute_all_matches_separate_calculations(self):
+        """Test that the fused compute_all() pass matches its two halves."""
+        article = Article(
+            "Coffee always cures pain. Coffee never fails anyone. "
+            "Sleep may help recovery. See https://coffee.org and https://sleep.org"
+        )
+        article.clean()
+        article.extract_claims(min_len=10)
+        article.extract_citations()
+        
+        for citations in (article.citations, []):
+            fused = RiskScorer(article.claims, citations, [("flu", "mismatch")])
+            fused.compute_all()
+            separate = RiskScorer(article.claims, citations, [("flu", "mismatch")])
+            separate.calculate()
+            separate.build_evidence_map()
+            
+            assert fused.score == separate.score
+            assert fused.risk_level == separate.risk_level
+            assert fused.evidence_map == separate.evidence_map
+    
+    def test_trends_ignore_edits_to_reports_copy(self):
+        """Test that editing the returned reports list cannot skew trends."""
         analyzer = Analyzer()
-        article = analyzer.add_article("Test", "https://test.com")
+        analyzer.analyze_article(analyzer.add_article("Always cures!", "https://test.com"))
+        trends = analyzer.summarize_trends()
+        
+        analyzer.reports.clear()
+        assert len(analyzer.reports) == 1
+        assert analyzer.summarize_trends() == trends
+    
+    def test_score_cache_does_not_keep_articles_alive(self):
+        """Test that the re-analysis cache lets unreferenced articles go."""
+        analyzer = Analyzer()
+        article = Article("Coffee always cures everything!")
+        article.clean()
+        article.extract_claims(min_len=10)
+        article.extract_citations()
+        analyzer.analyze_article(article)
+        
+        article_ref = weakref.ref(article)
+        analyzer._reports.clear()
+        del article
+        gc.collect()
+        assert article_ref() is None
+    
+    def test_reports_do_not_share_score_dicts(self):
+        """Test that memoized scores are copied into each report."""
+        analyzer = Analyzer()
+        first = analyzer.analyze_article(analyzer.add_article("Always cures!", "https://test.com"))
+        second = analyzer.analyze_article(analyzer.add_article("Always cures!", "https://test.com"))
+        
+        assert first.score == second.score
+        assert first.score is not second.score
+        first.score["total"] = 99
+        assert second.score["total"] != 99
+    
+    def test_reports_do_not_share_evidence_maps(self):
+        """Test that each report gets its own copy of the article's evidence map."""
+        analyzer = Analyzer()
+        article = analyzer.add_article("Vitamin C always cures colds. See https://a.com")
+        first = analyzer.analyze_article(article)
+        second = analyzer.analyze_article(article)
+        
+        claim_id = article.claims[0]["id"]
+        assert first.evidence_map == second.evidence_map == article.evidence_map
+        first.evidence_map[claim_id].append("https://changed.com")
+        assert "https://changed.com" not in second.evidence_map[claim_id]
+        assert "https://changed.com" not in article.evidence_map[claim_id]
+    
+    def test_composition_vs_inheritance(self, fresh_article):
+        """Test understanding: composition (HAS-A) vs inheritance (IS-A)."""
+        article = fresh_article
         report = CSVReport(article, {"total": 1}, [], [])
         
         # Inheritance (IS-A): CSVReport IS-A BaseReport
@@ -355,6 +506,15 @@ class TestComposition:
         # But Report is NOT an Article
         assert not isinstance(report, Article)
     
+    def test_injected_report_class_is_used(self):
+        """Test that the report_class passed to Analyzer is the one produced."""
+        analyzer = Analyzer(report_class=JSONReport)
+        article = analyzer.add_article("Coffee cures headaches.", "https://test.com")
+        report = analyzer.analyze_article(article)
+        
+        assert type(report) is JSONReport
+        assert analyzer.reports[-1] is report
+    
     def test_deep_composition_chain(self):
         """Test composition through multiple levels."""
         analyzer = Analyzer()
@@ -0,0 +1,126 @@
+import functools
+import multiprocessing
+import types
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from src import misinfo_library
+from src.analyzer import Analyzer
+from src.json_report import JSONReport
+
+
+class TestBatchAnalysis(unittest.TestCase):
+    """Integration test: batch analysis matches one-at-a-time analysis."""
+
+    def setUp(self):
+        self.texts = [
+            "Coffee always cures headaches. More info: https://example.com",
+            "This miracle vaccine prevents every illness.",
+            "Regular sleep may reduce risk of migraines.",
+        ]
+        self.urls = ["https://site1.com", None, "https://site3.com/health"]
+
+    def _make_analyzer(self):
+        analyzer = Analyzer(report_class=JSONReport)
+        analyzer.glossary.add_term("headaches", ["may reduce risk"])
+        analyzer.glossary.add_term("vaccine", ["immunization"])
+        return analyzer
+
+    def test_batch_matches_serial(self):
+        serial = self._make_analyzer()
+        expected = [
+            serial.analyze_article(serial.add_article(text, url))
+            for text, url in zip(self.texts, self.urls)
+        ]
+
+        batch = self._make_analyzer()
+        reports = batch.analyze_batch(self.texts, self.urls, max_workers=2)
+
+        self.assertEqual(len(reports), len(expected))
+        for got, want in zip(reports, expected):
+            self.assertIsInstance(got, JSONReport)
+            self.assertEqual(got.score, want.score)
+            self.assertEqual(got.mismatches, want.mismatches)
+            self.assertEqual(got._article.domain, want._article.domain)
+        self.assertEqual(batch.summarize_trends(), serial.summarize_trends())
+        self.assertEqual(len(batch.reports), len(self.texts))
+
+    def test_threaded_matches_serial(self):
+        serial = self._make_analyzer()
+        expected = [
+            serial.analyze_article(serial.add_article(text, url))
+            for text, url in zip(self.texts, self.urls)
+        ]
+
+        threaded = self._make_analyzer()
+        articles = [
+            threaded.add_article(text, url)
+            for text, url in zip(self.texts, self.urls)
+        ]
+        reports = threaded.analyze_articles(articles, max_workers=3)
+
+        self.assertEqual(len(reports), len(expected))
+        for got, want, article in zip(reports, expected, articles):
+            self.assertIs(got._article, article)
+            self.assertEqual(got.score, want.score)
+            self.assertEqual(got.mismatches, want.mismatches)
+        self.assertEqual(threaded.reports, reports)
+        self.assertEqual(threaded.summarize_trends(), serial.summarize_trends())
+
+    def test_claim_ids_unique_across_workers(self):
+        serial = self._make_analyzer()
+        serial_ids = [
+            claim["id"]
+            for text in self.texts
+            for claim in serial.add_article(text).claims
+        ]
+        reports = self._make_analyzer().analyze_batch(
+            self.texts * 20, max_workers=2
+        )
+        batch_ids = [
+            claim["id"] for report in reports for claim in report._article.claims
+        ]
+
+        all_ids = serial_ids + batch_ids
+        self.assertTrue(batch_ids)
+        self.assertEqual(len(set(all_ids)), len(all_ids))
+
+    def test_claim_ids_unique_across_spawned_workers(self):
+        # Spawned workers re-import the library instead of inheriting the
+        # parent's state through fork, so they take a different ID path.
+        spawn_executor = functools.partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+        )
+        analyzer = self._make_analyzer()
+        serial_ids = [claim["id"] for claim in analyzer.add_article(self.texts[0]).claims]
+        with mock.patch("src.analyzer.ProcessPoolExecutor", spawn_executor):
+            reports = analyzer.analyze_batch(self.texts * 20, max_workers=2)
+        batch_ids = [
+            claim["id"] for report in reports for claim in report._article.claims
+        ]
+
+        all_ids = serial_ids + batch_ids
+        self.assertTrue(batch_ids)
+        self.assertEqual(len(set(all_ids)), len(all_ids))
+
+    def test_claim_ids_unique_across_batches_with_reused_pids(self):
+        # Forked workers inherit the patch, so every worker of both batches
+        # reports the same PID, as if the OS had reused it.
+        analyzer = self._make_analyzer()
+        same_pid = types.SimpleNamespace(getpid=lambda: 4242)
+        with mock.patch.object(misinfo_library, "os", same_pid):
+            reports = analyzer.analyze_batch(self.texts, max_workers=1)
+            reports += analyzer.analyze_batch(self.texts, max_workers=1)
+        ids = [claim["id"] for report in reports for claim in report._article.claims]
+
+        self.assertTrue(ids)
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_mismatched_urls_raise(self):
+        with self.assertRaises(ValueError):
+            self._make_analyzer().analyze_batch(self.texts, self.urls[:1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 from src.persistence import PersistenceManager
@@ -6,11 +7,9 @@ from src.persistence import PersistenceManager
 class TestFileCreation(unittest.TestCase):
 
     def setUp(self):
-        self.file = Path("tests/integration/created.json")
-
-    def tearDown(self):
-        if self.file.exists():
-            self.file.unlink()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.file = Path(tmp.name) / "created.json"
 
     def test_file_is_created_on_save(self):
         PersistenceManager.save_results({"status": "ok"}, str(self.file))
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 from src.persistence import PersistenceManager
@@ -6,17 +7,15 @@ from src.persistence import PersistenceManager
 class TestMultipleKeys(unittest.TestCase):
 
     def setUp(self):
-        self.file = Path("tests/integration/multi_keys.json")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.file = Path(tmp.name) / "multi_keys.json"
         self.data = {
             "article": "Test",
             "risk": 0.7,
             "flags": ["clickbait", "missing_citation"]
         }
 
-    def tearDown(self):
-        if self.file.exists():
-            self.file.unlink()
-
     def test_all_keys_preserved(self):
         PersistenceManager.save_results(self.data, str(self.file))
         loaded = PersistenceManager.load_results(str(self.file))
@@ -1,12 +1,18 @@
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
+
+from src import persistence
 from src.persistence import PersistenceManager
 
 
 class TestNestedData(unittest.TestCase):
 
     def setUp(self):
-        self.file = Path("tests/integration/nested.json")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.file = Path(tmp.name) / "nested.json"
         self.data = {
             "articles": [
                 {"id": 1, "risk": 0.2},
@@ -15,15 +21,49 @@ class TestNestedData(unittest.TestCase):
             "summary": {"average": 0.55}
         }
 
-    def tearDown(self):
-        if self.file.exists():
-            self.file.unlink()
-
     def test_nested_data_persists_correctly(self):
         PersistenceManager.save_results(self.data, str(self.file))
         loaded = PersistenceManager.load_results(str(self.file))
         self.assertEqual(loaded, self.data)
 
+    @unittest.skipIf(persistence.orjson is None, "orjson not installed")
+    def test_streamed_file_matches_single_dump(self):
+        orjson = persistence.orjson
+        many = {"articles": [{"id": i, "risk": i / 10} for i in range(7)],
+                "summary": {"average": 0.3}}
+        # A tiny batch size forces several batches per container.
+        with mock.patch.object(persistence, "_STREAM_BATCH", 2):
+            for data in (self.data, many, many["articles"], [], {}):
+                PersistenceManager.save_results(data, str(self.file))
+                self.assertEqual(
+                    self.file.read_bytes(),
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                )
+
+    @unittest.skipIf(persistence.orjson is None, "orjson not installed")
+    def test_nested_article_list_is_streamed(self):
+        orjson = persistence.orjson
+        data = {"articles": [{"id": i, "risk": i / 10} for i in range(7)],
+                "summary": {"average": 0.3}}
+        with mock.patch.object(persistence, "_STREAM_BATCH", 2):
+            chunks = list(persistence._orjson_chunks(data))
+
+        # The 7 articles go out in 4 batches, never as one encoded document
+        self.assertGreater(len(chunks), 4)
+        self.assertEqual(
+            b"".join(chunks), orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        )
+
+    def test_failed_save_leaves_previous_file(self):
+        PersistenceManager.save_results(self.data, str(self.file))
+        bad = [{"id": i} for i in range(5)] + [object()]
+        with mock.patch.object(persistence, "_STREAM_BATCH", 2):
+            with self.assertRaises(TypeError):
+                PersistenceManager.save_results(bad, str(self.file))
+
+        self.assertEqual(PersistenceManager.load_results(str(self.file)), self.data)
+        self.assertEqual(list(self.file.parent.iterdir()), [self.file])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 from src.persistence import PersistenceManager
@@ -7,22 +8,31 @@ class TestPersistenceIntegration(unittest.TestCase):
     """Integration test: persistence + filesystem + data."""
 
     def setUp(self):
-        self.file = Path("tests/integration/integration_test.json")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.file = Path(tmp.name) / "integration_test.json"
         self.data = {
             "article": "Integration test article",
             "risk_score": 0.8,
             "flags": ["clickbait"]
         }
 
-    def tearDown(self):
-        if self.file.exists():
-            self.file.unlink()
-
     def test_save_and_load_integration(self):
         PersistenceManager.save_results(self.data, str(self.file))
         loaded = PersistenceManager.load_results(str(self.file))
         self.assertEqual(loaded, self.data)
 
+    def test_json_only_data_round_trips(self):
+        # orjson rejects these, so save_results falls back to json for them
+        PersistenceManager.save_results({1: "a", "big": 2 ** 70}, str(self.file))
+        loaded = PersistenceManager.load_results(str(self.file))
+        self.assertEqual(loaded, {"1": "a", "big": 2 ** 70})
+
+    def test_loads_nan_written_by_json(self):
+        self.file.write_text('{"risk_score": NaN}', encoding="utf-8")
+        loaded = PersistenceManager.load_results(str(self.file))
+        self.assertNotEqual(loaded["risk_score"], loaded["risk_score"])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
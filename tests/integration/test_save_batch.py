@@ -0,0 +1,40 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.analyzer import Analyzer
+from src.json_report import JSONReport
+from src.persistence import PersistenceManager
+
+
+class TestSaveBatch(unittest.TestCase):
+    """Integration test: analyzer reports + batch persistence."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.file = Path(tmp.name) / "batch.json"
+
+        self.analyzer = Analyzer(report_class=JSONReport)
+        for text in ("Coffee always cures headaches.", "Sleep may help."):
+            self.analyzer.analyze_article(
+                self.analyzer.add_article(text, "https://test.com")
+            )
+
+    def test_batch_round_trip(self):
+        PersistenceManager.save_batch(self.analyzer.reports, self.file)
+        loaded = PersistenceManager.load_results(self.file)
+
+        self.assertIsInstance(loaded, list)
+        self.assertEqual(len(loaded), len(self.analyzer.reports))
+        for summary, report in zip(loaded, self.analyzer.reports):
+            self.assertEqual(summary["risk_total"], report.score["total"])
+            self.assertEqual(summary["format"], "JSON")
+
+    def test_non_list_raises(self):
+        with self.assertRaises(TypeError):
+            PersistenceManager.save_batch(tuple(self.analyzer.reports), self.file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -8,10 +9,11 @@ class TestMissingFile(unittest.TestCase):
     """System test for handling missing save files."""
 
     def test_missing_file_raises_error(self):
-        missing_file = Path("tests/system/does_not_exist.json")
+        with tempfile.TemporaryDirectory() as tmp:
+            missing_file = Path(tmp) / "does_not_exist.json"
 
-        with self.assertRaises(RuntimeError):
-            PersistenceManager.load_results(str(missing_file))
+            with self.assertRaises(RuntimeError):
+                PersistenceManager.load_results(str(missing_file))
 
 
 if __name__ == "__main__":